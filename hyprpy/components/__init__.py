@@ -108,6 +108,32 @@ This is similar to object relational mappers (ORMs) you may be familiar with, su
     Because Hyprland manages socket operations synchronously, performing many relational
     lookups in quick succession may impact its performance, leading to lags or, in the worst case, freezing.
 
+If we perform many lookups in a short time, we can let the instance reuse the components it has retrieved for
+a few moments, by passing a ``cache_ttl`` (in seconds) when creating it:
+
+.. code-block:: python
+
+    from hyprpy import Hyprland
+
+    instance = Hyprland(cache_ttl=0.5)
+
+    # Only the first window's workspace is retrieved from Hyprland, the others come from the cache
+    for window in instance.get_windows():
+        print(window.workspace.name)
+
+Components retrieved from the cache may be up to ``cache_ttl`` seconds old. The cache is cleared
+whenever we run a dispatcher through :meth:`~hyprpy.components.instances.Instance.dispatch`, and, while the
+instance is :ref:`watching for events <guide-events>`, as soon as Hyprland reports an event.
+Commands sent directly through the instance's ``command_socket`` do not clear the cache.
+Note that Hyprland does not report every change, e.g. windows being moved or resized by the mouse.
+
+If we need windows, workspaces and monitors at the same time, :meth:`~hyprpy.components.instances.Instance.refresh_all`
+retrieves all of them from Hyprland in a single request:
+
+.. code-block:: python
+
+    windows, workspaces, monitors = instance.refresh_all()
+
 .. _guide-events:
 
 Reacting to events
@@ -140,6 +166,10 @@ In this example, we defined our own callback function called ``workspace_changed
 The function executes a shell command, ``notify-send``, with ``"Workspace Changed"`` as an argument.
 We used a helper function called :func:`~hyprpy.utils.shell.run_or_fail` here to run the shell command,
 but the body of our callback function can be any valid python code.
+:func:`~hyprpy.utils.shell.run_or_fail` waits for the command to finish, and no further events are handled
+in the meantime. If we don't need the command's output, :func:`~hyprpy.utils.shell.run_in_background`
+starts the command and returns right away. It returns the started process, which we should keep and
+reap later by calling its :meth:`~subprocess.Popen.poll` or :meth:`~subprocess.Popen.wait` method.
 
 Then, we *connected* our callback function to the Instance's :attr:`~hyprpy.components.instances.Instance.signal_active_workspace_changed`
 signal and, finally, we called the Instance's :meth:`~hyprpy.components.instances.Instance.watch` method.
@@ -210,12 +240,53 @@ The following table shows a list of available signals, and the data they send to
 
 
 .. note:: The :meth:`~hyprpy.components.instances.Instance.watch` method is a blocking operation that runs 
-   indefinitely.
+   indefinitely. If Hyprland exits and closes its event socket, it raises a :class:`~hyprpy.utils.sockets.SocketError`.
 
 Using signals in conjunction with :meth:`~hyprpy.components.instances.Instance.watch` is much more efficient
 than polling, because Hyprpy watches `Hyprland's event socket <https://wiki.hyprland.org/IPC/#tmphyprhissocket2sock>`_
 directly, saving on CPU time and I/O operations.
 
+.. _guide-events-async:
+
+Reacting to events asynchronously
+---------------------------------
+
+If our program already runs an :mod:`asyncio` event loop, we can await
+:meth:`~hyprpy.components.instances.Instance.awatch` instead. It emits the same signals as
+:meth:`~hyprpy.components.instances.Instance.watch`, but lets other tasks run while no events arrive:
+
+.. code-block:: python
+
+    import asyncio
+
+    from hyprpy import Hyprland
+
+    instance = Hyprland()
+
+    def workspace_changed(sender, **kwargs):
+        print(f"Workspace is now {kwargs.get('active_workspace_id')}")
+
+    instance.signal_active_workspace_changed.connect(workspace_changed)
+
+    async def main():
+        watcher = asyncio.create_task(instance.awatch())
+        ... # do other things concurrently
+        await watcher
+
+    asyncio.run(main())
+
+The coroutine runs until its task is cancelled. If Hyprland exits and closes its event socket,
+the coroutine raises a :class:`~hyprpy.utils.sockets.SocketError` instead. Hyprpy works with any asyncio event loop.
+For lower event loop overhead, `uvloop <https://github.com/MagicStack/uvloop>`_ can be installed
+separately and enabled before starting the loop:
+
+.. code-block:: python
+
+    import uvloop
+
+    uvloop.install()
+    asyncio.run(main())
+
 Component state
 ---------------
 
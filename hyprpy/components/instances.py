@@ -4,11 +4,16 @@ This class acts as the root for accessing other components like workspaces, wind
 and offers capabilities to listen to events and signals emitted by the underlying Hyprland system.
 """
 
-from typing import List, Union
-import json
+from typing import Any, Callable, Dict, List, Tuple, Union
+from functools import lru_cache
 import logging
+import re
+import time
 
-from hyprpy.data.models import InstanceData
+from hyprpy.data.models import (
+    InstanceData, WindowData, WorkspaceData, MonitorData,
+    WINDOW_DATA_LIST_ADAPTER, WORKSPACE_DATA_LIST_ADAPTER, MONITOR_DATA_LIST_ADAPTER,
+)
 from hyprpy.components.windows import Window
 from hyprpy.components.workspaces import Workspace
 from hyprpy.components.monitors import Monitor
@@ -19,6 +24,33 @@ from hyprpy.utils.signals import Signal
 
 log = logging.getLogger(__name__)
 
+@lru_cache(maxsize=64)
+def _compile_event_pattern(event_names: Tuple[str, ...]) -> re.Pattern:
+    """Returns a pattern matching the lines of event socket data for the events named in ``event_names``.
+
+    The pattern captures each matching event's name and data. All other events are skipped over without being split.
+    """
+
+    return re.compile(rf'^({"|".join(event_names)})>>(.*)$', re.MULTILINE)
+
+
+def _parse_window_address(event_data: str) -> str:
+    """Returns the window address from the data of an ``openwindow`` event."""
+
+    return event_data.partition(',')[0]
+
+
+def _parse_active_window_address(event_data: str) -> Union[str, None]:
+    """Returns the window address from the data of an ``activewindowv2`` event, or ``None`` if no window is active."""
+
+    return None if event_data == ',' else event_data
+
+
+def _parse_workspace_id(event_data: str) -> int:
+    """Returns the workspace ID from the data of a workspace event, where special workspaces have the ID ``-99``."""
+
+    return int(event_data) if event_data not in ['special', 'special:special'] else -99
+
 
 class Instance:
     """Represents an active Hyprland instance.
@@ -30,7 +62,7 @@ class Instance:
     :seealso: :ref:`Components: The Instance <guide-instance>`
     """
 
-    def __init__(self, signature: str | None = None):
+    def __init__(self, signature: str | None = None, cache_ttl: int | float = 0):
         if signature is None:
             signature = shell.get_env_var_or_fail('HYPRLAND_INSTANCE_SIGNATURE')
         data = InstanceData(signature=signature)
@@ -43,6 +75,13 @@ class Instance:
         #: The Hyprland command socket for this instance.
         self.command_socket: CommandSocket = CommandSocket(signature)
 
+        assertions.assert_is_float_or_int(cache_ttl)
+        #: Number of seconds for which the windows, workspaces and monitors retrieved from Hyprland are reused
+        #: by subsequent calls, instead of being retrieved again. Caching is disabled if this is ``0`` (the default).
+        #: The cache is cleared by :meth:`dispatch`, and, while :meth:`watch` or :meth:`awatch` is running, whenever
+        #: Hyprland reports an event. Commands sent directly through :attr:`command_socket` do not clear the cache.
+        self.cache_ttl: int | float = cache_ttl
+
         #: Signal emitted when a new workspace gets created. Sends ``created_workspace_id``, the :attr:`~hyprpy.components.workspaces.Workspace.id` of the created workspace, as signal data.
         self.signal_workspace_created: Signal = Signal(self)
         #: Signal emitted when an existing workspace gets destroyed. Sends ``destroyed_workspace_id``, the :attr:`~hyprpy.components.workspaces.Workspace.id` of the destroyed workspace, as signal data
@@ -57,6 +96,28 @@ class Instance:
         #: Signal emitted when the focus changes to another window. Sends ``active_window_address``, the :attr:`~hyprpy.components.windows.Window.address` of the now active window, as signal data.
         self.signal_active_window_changed: Signal = Signal(self)
 
+        # Indexes over the most recently fetched components, rebuilt whenever they are fetched
+        self._windows_by_address: Dict[int, Window] = {}
+        self._windows_by_workspace_id: Dict[int, List[Window]] = {}
+        self._workspaces_by_id: Dict[int, Workspace] = {}
+        self._workspaces_by_name: Dict[str, Workspace] = {}
+        self._workspaces_by_monitor_name: Dict[str, List[Workspace]] = {}
+        self._monitors_by_id: Dict[int, Monitor] = {}
+        self._monitors_by_name: Dict[str, Monitor] = {}
+        # Monotonic time at which each of the indexes above was last rebuilt, by the query which rebuilt it
+        self._fetched_at: Dict[str, float] = {}
+
+        # Maps the names of signalled events to the signal emitted for the event, the name under which
+        # the signal data is sent, and a function parsing the signal data from the event's data
+        self._signal_for_event: Dict[str, Tuple[Signal, str, Callable[[str], Any]]] = {
+            'openwindow': (self.signal_window_created, 'created_window_address', _parse_window_address),
+            'closewindow': (self.signal_window_destroyed, 'destroyed_window_address', str),
+            'activewindowv2': (self.signal_active_window_changed, 'active_window_address', _parse_active_window_address),
+
+            'createworkspace': (self.signal_workspace_created, 'created_workspace_id', _parse_workspace_id),
+            'destroyworkspace': (self.signal_workspace_destroyed, 'destroyed_workspace_id', _parse_workspace_id),
+            'workspace': (self.signal_active_workspace_changed, 'active_workspace_id', _parse_workspace_id),
+        }
 
     def __repr__(self):
         return f"<Instance(signature={self.signature!r})>"
@@ -76,6 +137,8 @@ class Instance:
             instance = Hyprland()
             instance.dispatch(["cyclenext", "prev"])
 
+        If a :attr:`~Instance.cache_ttl` is set, the cached components are discarded after dispatching.
+
         :param arguments: A list of strings containing the arguments of the dispatch command.
         :type arguments: list[str]
         :return: `None` if the command succeeded, otherwise a string indicating errors.
@@ -83,6 +146,8 @@ class Instance:
         """
 
         dispatch_response = self.command_socket.send_command('dispatch', flags=['-j'], args=arguments)
+        # The dispatcher may have changed the cached components
+        self._fetched_at.clear()
         dispatch_error = dispatch_response if dispatch_response != 'ok' else None
         return dispatch_error
 
@@ -93,8 +158,11 @@ class Instance:
         :return: A list containing :class:`~hyprpy.components.windows.Window` objects.
         """
 
-        windows_data = json.loads(self.command_socket.send_command('clients', flags=['-j']))
-        return [Window(window_data, self) for window_data in windows_data]
+        if self._is_cached('clients'):
+            return list(self._windows_by_address.values())
+
+        windows_data = WINDOW_DATA_LIST_ADAPTER.validate_json(self.command_socket.send_command('clients', flags=['-j']))
+        return self._update_windows(windows_data)
 
     def get_window_by_address(self, address: str) -> Union['Window', None]:
         """Retrieves the :class:`~hyprpy.components.windows.Window` with the specified ``address``.
@@ -106,10 +174,25 @@ class Instance:
         :raises: :class:`ValueError` if ``address`` is not a valid hexadecimal string.
         """
 
+        # The parsed address is used as the lookup key
         assertions.assert_is_hexadecimal_string(address)
-        for window in self.get_windows():
-            if window.address_as_int == int(address, 16):
-                return window
+        address_as_int = int(address, 16)
+
+        self.get_windows()
+        return self._windows_by_address.get(address_as_int)
+
+    def get_windows_by_workspace(self) -> Dict[int, List['Window']]:
+        """Returns all :class:`~hyprpy.components.windows.Window`\\ s, grouped by the ID of the workspace they are on.
+
+        All windows are retrieved at once, so this is cheaper than accessing
+        :attr:`~hyprpy.components.workspaces.Workspace.windows` of several workspaces in turn.
+
+        :return: A dictionary mapping each :attr:`~hyprpy.components.workspaces.Workspace.id` to a list
+            containing the :class:`~hyprpy.components.windows.Window`\\ s on that workspace.
+        """
+
+        self.get_windows()
+        return {workspace_id: list(windows) for workspace_id, windows in self._windows_by_workspace_id.items()}
 
     def get_active_window(self) -> 'Window':
         """Returns the currently active :class:`~hyprpy.components.windows.Window`.
@@ -117,7 +200,7 @@ class Instance:
         :return: The currently active :class:`~hyprpy.components.windows.Window`.
         """
 
-        window_data = json.loads(self.command_socket.send_command('activewindow', flags=['-j']))
+        window_data = WindowData.model_validate_json(self.command_socket.send_command('activewindow', flags=['-j']))
         return Window(window_data, self)
 
 
@@ -127,8 +210,11 @@ class Instance:
         :return: A list containing :class:`~hyprpy.components.workspaces.Workspace`\\ s.
         """
 
-        workspaces_data = json.loads(self.command_socket.send_command('workspaces', flags=['-j']))
-        return [Workspace(workspace_data, self) for workspace_data in workspaces_data]
+        if self._is_cached('workspaces'):
+            return list(self._workspaces_by_id.values())
+
+        workspaces_data = WORKSPACE_DATA_LIST_ADAPTER.validate_json(self.command_socket.send_command('workspaces', flags=['-j']))
+        return self._update_workspaces(workspaces_data)
 
     def get_workspace_by_id(self, id: int) -> Union['Workspace', None]:
         """Retrieves the :class:`~hyprpy.components.workspaces.Workspace` with the specified ``id``.
@@ -138,9 +224,8 @@ class Instance:
         """
 
         assertions.assert_is_int(id)
-        for workspace in self.get_workspaces():
-            if workspace.id == id:
-                return workspace
+        self.get_workspaces()
+        return self._workspaces_by_id.get(id)
 
     def get_active_workspace(self) -> 'Workspace':
         """Retrieves the currently active :class:`~hyprpy.components.workspaces.Workspace`.
@@ -148,7 +233,7 @@ class Instance:
         :return: The currently active :class:`~hyprpy.components.workspaces.Workspace`.
         """
 
-        workspace_data = json.loads(self.command_socket.send_command('activeworkspace', flags=['-j']))
+        workspace_data = WorkspaceData.model_validate_json(self.command_socket.send_command('activeworkspace', flags=['-j']))
         return Workspace(workspace_data, self)
 
     def get_workspace_by_name(self, name: int) -> Union['Workspace', None]:
@@ -159,9 +244,21 @@ class Instance:
         """
 
         assertions.assert_is_string(name)
-        for workspace in self.get_workspaces():
-            if workspace.name == name:
-                return workspace
+        self.get_workspaces()
+        return self._workspaces_by_name.get(name)
+
+    def get_workspaces_by_monitor(self) -> Dict[str, List['Workspace']]:
+        """Returns all :class:`~hyprpy.components.workspaces.Workspace`\\ s, grouped by the name of the monitor they are on.
+
+        All workspaces are retrieved at once, so this is cheaper than accessing
+        :attr:`~hyprpy.components.monitors.Monitor.workspaces` of several monitors in turn.
+
+        :return: A dictionary mapping each :attr:`~hyprpy.components.monitors.Monitor.name` to a list
+            containing the :class:`~hyprpy.components.workspaces.Workspace`\\ s on that monitor.
+        """
+
+        self.get_workspaces()
+        return {monitor_name: list(workspaces) for monitor_name, workspaces in self._workspaces_by_monitor_name.items()}
 
 
     def get_monitors(self) -> List['Monitor']:
@@ -170,8 +267,11 @@ class Instance:
         :return: A list containing :class:`~hyprpy.components.monitors.Monitor`\\ s.
         """
 
-        monitors_data = json.loads(self.command_socket.send_command('monitors', flags=['-j']))
-        return [Monitor(monitor_data, self) for monitor_data in monitors_data]
+        if self._is_cached('monitors'):
+            return list(self._monitors_by_id.values())
+
+        monitors_data = MONITOR_DATA_LIST_ADAPTER.validate_json(self.command_socket.send_command('monitors', flags=['-j']))
+        return self._update_monitors(monitors_data)
 
     def get_monitor_by_id(self, id: int) -> Union['Monitor', None]:
         """Retrieves the :class:`~hyprpy.components.monitors.Monitor` with the specified ``id``.
@@ -181,9 +281,8 @@ class Instance:
         """
 
         assertions.assert_is_int(id)
-        for monitor in self.get_monitors():
-            if monitor.id == id:
-                return monitor
+        self.get_monitors()
+        return self._monitors_by_id.get(id)
 
     def get_monitor_by_name(self, name: str) -> Union['Monitor', None]:
         """Retrieves the :class:`~hyprpy.components.monitors.Monitor` with the specified ``name``.
@@ -194,9 +293,35 @@ class Instance:
         """
 
         assertions.assert_is_nonempty_string(name)
-        for monitor in self.get_monitors():
-            if monitor.name == name:
-                return monitor
+        self.get_monitors()
+        return self._monitors_by_name.get(name)
+
+
+    def refresh_all(self) -> Tuple[List['Window'], List['Workspace'], List['Monitor']]:
+        """Retrieves all windows, workspaces and monitors from Hyprland in a single request.
+
+        This is cheaper than calling :meth:`~Instance.get_windows`, :meth:`~Instance.get_workspaces`
+        and :meth:`~Instance.get_monitors` in turn, and the three lists reflect the same state of Hyprland.
+        If a :attr:`~Instance.cache_ttl` is set, the retrieved components are cached just like those
+        retrieved by the individual methods.
+
+        :return: A tuple containing the list of :class:`~hyprpy.components.windows.Window`\\ s,
+            the list of :class:`~hyprpy.components.workspaces.Workspace`\\ s and the list of
+            :class:`~hyprpy.components.monitors.Monitor`\\ s.
+        """
+
+        windows_response, workspaces_response, monitors_response = self.command_socket.send_commands(
+            ['clients', 'workspaces', 'monitors'], flags=['-j']
+        )
+        # Validate all responses before updating anything, so that a failure leaves the previous state intact
+        windows_data = WINDOW_DATA_LIST_ADAPTER.validate_json(windows_response)
+        workspaces_data = WORKSPACE_DATA_LIST_ADAPTER.validate_json(workspaces_response)
+        monitors_data = MONITOR_DATA_LIST_ADAPTER.validate_json(monitors_response)
+        return (
+            self._update_windows(windows_data),
+            self._update_workspaces(workspaces_data),
+            self._update_monitors(monitors_data),
+        )
 
 
     def watch(self) -> None:
@@ -205,54 +330,114 @@ class Instance:
         This is a blocking method which runs indefinitely.
         Signals are continuosly emitted, as soon as Hyprland events are detected.
 
+        :raises: :class:`~hyprpy.utils.sockets.SocketError` if Hyprland closes the event socket, e.g. when it exits.
+
         :seealso: :ref:`Components: Reacting to events <guide-events>`
         """
 
-        def _handle_socket_data(data: str):
-            signal_for_event = {
-                'openwindow': self.signal_window_created,
-                'closewindow': self.signal_window_destroyed,
-                'activewindowv2': self.signal_active_window_changed,
-
-                'createworkspace': self.signal_workspace_created,
-                'destroyworkspace': self.signal_workspace_destroyed,
-                'workspace': self.signal_active_workspace_changed,
-            }
-
-            lines = list(filter(lambda line: len(line) > 0, data.split('\n')))
-            for line in lines:
-                event_name, event_data = line.split('>>', maxsplit=1)
-
-                # Pick the signal to emit based on the event's name
-                if event_name not in signal_for_event:
-                    continue
-                signal = signal_for_event[event_name]
-                if not signal._observers:
-                    # If the signal has no observers, just exit
-                    continue
-
-                # We send specific data along with the signal, depending on the event
-                if event_name == 'openwindow':
-                    signal.emit(created_window_address=event_data.split(',')[0])
-                elif event_name == 'closewindow':
-                    signal.emit(destroyed_window_address=event_data)
-                elif event_name == 'activewindowv2':
-                    signal.emit(active_window_address=(None if event_data == ',' else event_data))
-
-                elif event_name == 'createworkspace':
-                    signal.emit(created_workspace_id=(int(event_data) if event_data not in ['special', 'special:special'] else -99))
-                elif event_name == 'destroyworkspace':
-                    signal.emit(destroyed_workspace_id=(int(event_data) if event_data not in ['special', 'special:special'] else -99))
-                elif event_name == 'workspace':
-                    signal.emit(active_workspace_id=(int(event_data) if event_data not in ['special', 'special:special'] else -99))
+        try:
+            self.event_socket.connect()
 
+            # Incomplete event at the end of the data read so far
+            unparsed_data = ''
+            while True:
+                self.event_socket.wait()
+                data, _, unparsed_data = (unparsed_data + self.event_socket.read()).rpartition('\n')
+                self._handle_socket_data(data)
+        finally:
+            self.event_socket.close()
+
+
+    async def awatch(self) -> None:
+        """Asynchronous counterpart to :meth:`~hyprpy.components.instances.Instance.watch`.
+
+        Monitors the :class:`~hyprpy.utils.sockets.EventSocket` from within a running :mod:`asyncio`
+        event loop, and emits the same :class:`~hyprpy.utils.signals.Signal`\\ s as
+        :meth:`~hyprpy.components.instances.Instance.watch`. Other tasks keep running while
+        no events arrive. The coroutine runs indefinitely, until it is cancelled.
+
+        :raises: :class:`~hyprpy.utils.sockets.SocketError` if Hyprland closes the event socket, e.g. when it exits.
+        :seealso: :ref:`Components: Reacting to events asynchronously <guide-events-async>`
+        """
 
         try:
             self.event_socket.connect()
 
+            # Incomplete event at the end of the data read so far
+            unparsed_data = ''
             while True:
-                self.event_socket.wait()
-                data = self.event_socket.read()
-                _handle_socket_data(data)
+                data, _, unparsed_data = (unparsed_data + await self.event_socket.aread()).rpartition('\n')
+                self._handle_socket_data(data)
         finally:
             self.event_socket.close()
+
+
+    def _update_windows(self, windows_data: List[WindowData]) -> List['Window']:
+        """Creates :class:`~hyprpy.components.windows.Window`\\ s from ``windows_data`` and indexes them."""
+
+        windows = [Window(window_data, self) for window_data in windows_data]
+        self._windows_by_address = {window.address_as_int: window for window in windows}
+        # The grouping is completed before it is assigned, so it is never seen partially filled
+        windows_by_workspace_id = {}
+        for window in windows:
+            windows_by_workspace_id.setdefault(window.workspace_id, []).append(window)
+        self._windows_by_workspace_id = windows_by_workspace_id
+        self._fetched_at['clients'] = time.monotonic()
+        return windows
+
+    def _update_workspaces(self, workspaces_data: List[WorkspaceData]) -> List['Workspace']:
+        """Creates :class:`~hyprpy.components.workspaces.Workspace`\\ s from ``workspaces_data`` and indexes them."""
+
+        workspaces = [Workspace(workspace_data, self) for workspace_data in workspaces_data]
+        self._workspaces_by_id = {workspace.id: workspace for workspace in workspaces}
+        self._workspaces_by_name = {workspace.name: workspace for workspace in workspaces}
+        # The grouping is completed before it is assigned, so it is never seen partially filled
+        workspaces_by_monitor_name = {}
+        for workspace in workspaces:
+            workspaces_by_monitor_name.setdefault(workspace.monitor_name, []).append(workspace)
+        self._workspaces_by_monitor_name = workspaces_by_monitor_name
+        self._fetched_at['workspaces'] = time.monotonic()
+        return workspaces
+
+    def _update_monitors(self, monitors_data: List[MonitorData]) -> List['Monitor']:
+        """Creates :class:`~hyprpy.components.monitors.Monitor`\\ s from ``monitors_data`` and indexes them."""
+
+        monitors = [Monitor(monitor_data, self) for monitor_data in monitors_data]
+        self._monitors_by_id = {monitor.id: monitor for monitor in monitors}
+        self._monitors_by_name = {monitor.name: monitor for monitor in monitors}
+        self._fetched_at['monitors'] = time.monotonic()
+        return monitors
+
+    def _is_cached(self, query: str) -> bool:
+        """Returns ``True`` if the components retrieved by ``query`` were retrieved less than :attr:`cache_ttl` seconds ago."""
+
+        if self.cache_ttl <= 0:
+            return False
+        fetched_at = self._fetched_at.get(query)
+        return fetched_at is not None and time.monotonic() - fetched_at < self.cache_ttl
+
+
+    def _handle_socket_data(self, data: str) -> None:
+        """Parses events from ``data`` read from the :class:`~hyprpy.utils.sockets.EventSocket`, and emits the corresponding signals.
+
+        Each event in ``data`` must be complete. Events may be cut off at the end of a single read from
+        the socket, so the caller holds back any data following the last newline until the rest of it arrives.
+        """
+
+        # Any event may have changed the cached components
+        if data and self._fetched_at:
+            self._fetched_at.clear()
+
+        # Only events whose signal has observers are parsed at all
+        observed_event_names = tuple(
+            event_name for event_name, (signal, _, _) in self._signal_for_event.items() if signal._observers
+        )
+        if not observed_event_names:
+            return
+
+        for event_name, event_data in _compile_event_pattern(observed_event_names).findall(data):
+            # Pick the signal to emit based on the event's name
+            signal, signal_data_name, parse_event_data = self._signal_for_event[event_name]
+
+            # We send specific data along with the signal, depending on the event
+            signal.emit(**{signal_data_name: parse_event_data(event_data)})
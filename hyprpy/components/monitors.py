@@ -1,6 +1,6 @@
 """`Monitor` objects represent monitors in Hyprland."""
 
-from typing import List
+from typing import List, Tuple, Union
 
 from hyprpy.data.models import MonitorData
 from hyprpy.components import instances, workspaces
@@ -8,8 +8,16 @@ from hyprpy.components import instances, workspaces
 class Monitor:
     """Represents a monitor within Hyprland."""
 
-    def __init__(self, monitor_data: str, instance: 'instances.Instance'):
-        data = MonitorData.model_validate(monitor_data)
+    __slots__ = (
+        'id', 'name', 'description', 'make', 'model', 'serial', 'width', 'height', 'refresh_rate',
+        'position_x', 'position_y', 'active_workspace_id', 'active_workspace_name', 'reserved', 'scale',
+        'transform', 'is_focused', 'uses_dpms', 'vrr',
+        '_instance', '__weakref__',
+    )
+
+    def __init__(self, monitor_data: Union[dict, MonitorData], instance: 'instances.Instance'):
+        # Data which has already been validated (e.g. in bulk by the instance) is used as is
+        data = monitor_data if isinstance(monitor_data, MonitorData) else MonitorData.model_validate(monitor_data)
 
         #: Numeric ID of the monitor.
         self.id: int = data.id
@@ -38,7 +46,7 @@ class Monitor:
         #: Assigned name of the workspace currently active on the monitor.
         self.active_workspace_name: str = data.active_workspace_name
         #: Unknown.
-        self.reserved: List[int] = data.reserved
+        self.reserved: Tuple[int, ...] = data.reserved
         #: Unknown.
         self.scale: float = data.scale
         #: Unknown.
@@ -58,11 +66,8 @@ class Monitor:
     def workspaces(self) -> List['workspaces.Workspace']:
         """All :class:`~hyprpy.components.workspace.Workspace`\\ s located on this monitor."""
 
-        workspaces = []
-        for workspace in self._instance.get_workspaces():
-            if workspace.monitor_name == self.name:
-                workspaces.append(workspace)
-        return workspaces
+        self._instance.get_workspaces()
+        return list(self._instance._workspaces_by_monitor_name.get(self.name, []))
 
 
     def __repr__(self):
@@ -1,5 +1,7 @@
 """:class:`Window` objects represent individual windows in Hyprland."""
 
+from typing import Union
+
 from hyprpy.data.models import WindowData
 from hyprpy.components import instances, workspaces
 from hyprpy.components.common import ParentNotFoundException
@@ -8,8 +10,16 @@ from hyprpy.components.common import ParentNotFoundException
 class Window:
     """Represents a window in the Hyprland compositor."""
 
-    def __init__(self, window_data: dict, instance: 'instances.Instance'):
-        data = WindowData.model_validate(window_data)
+    __slots__ = (
+        'address', 'is_mapped', 'is_hidden', 'position_x', 'position_y', 'width', 'height',
+        'workspace_id', 'workspace_name', 'is_floating', 'monitor_id', 'wm_class', 'title',
+        'initial_wm_class', 'initial_title', 'pid', 'is_xwayland', 'is_pinned', 'is_fullscreen',
+        '_address_as_int', '_workspace', '_instance', '__weakref__',
+    )
+
+    def __init__(self, window_data: Union[dict, WindowData], instance: 'instances.Instance'):
+        # Data which has already been validated (e.g. in bulk by the instance) is used as is
+        data = window_data if isinstance(window_data, WindowData) else WindowData.model_validate(window_data)
 
         #: String representation of a hexadecimal number, unique identifier for the window.
         self.address: str = data.address
@@ -50,25 +60,35 @@ class Window:
         #: Whether or not the window is in fullscreen mode.
         self.is_fullscreen: int = data.is_fullscreen
 
+        #: The window's address, parsed once since it is used for lookups.
+        self._address_as_int: int = int(self.address, 16)
+        #: The window's workspace, once it has been looked up through :attr:`~Window.workspace`.
+        self._workspace: Union['workspaces.Workspace', None] = None
         #: The :class:`~hyprpy.components.instances.Instance` managing this window.
         self._instance = instance
 
 
     @property
     def workspace(self) -> 'workspaces.Workspace':
-        """The :class:`~hyprpy.components.workspace.Workspace` which this window is in."""
+        """The :class:`~hyprpy.components.workspace.Workspace` which this window is in.
+
+        The workspace is looked up on first access only. Subsequent accesses return the same
+        :class:`~hyprpy.components.workspace.Workspace` object without querying Hyprland again.
+        """
 
-        workspace = self._instance.get_workspace_by_id(self.workspace_id)
-        if not workspace:
-            raise ParentNotFoundException(f"Parent workspace {self.workspace_id=} not found.")
-        return workspace
+        if self._workspace is None:
+            workspace = self._instance.get_workspace_by_id(self.workspace_id)
+            if not workspace:
+                raise ParentNotFoundException(f"Parent workspace {self.workspace_id=} not found.")
+            self._workspace = workspace
+        return self._workspace
 
 
     @property
     def address_as_int(self) -> int:
         """The integer representation of the window's :attr:`~hyprpy.data.models.WindowData.address` property."""
 
-        return int(self.address, 16)
+        return self._address_as_int
 
 
     def __repr__(self):
@@ -1,6 +1,6 @@
 """:class:`Workspace` objects represent individual workspaces in Hyprland."""
 
-from typing import List
+from typing import List, Union
 
 from hyprpy.data.models import WorkspaceData
 from hyprpy.components import instances, windows, monitors
@@ -10,8 +10,14 @@ from hyprpy.components.common import ParentNotFoundException
 class Workspace:
     """Represents a workspace in Hyprland."""
 
-    def __init__(self, workspace_data: dict, instance: 'instances.Instance'):
-        data = WorkspaceData.model_validate(workspace_data)
+    __slots__ = (
+        'id', 'name', 'monitor_name', 'last_window_address', 'last_window_title', 'window_count', 'has_fullscreen',
+        '_last_window_address_as_int', '_monitor', '_instance', '__weakref__',
+    )
+
+    def __init__(self, workspace_data: Union[dict, WorkspaceData], instance: 'instances.Instance'):
+        # Data which has already been validated (e.g. in bulk by the instance) is used as is
+        data = workspace_data if isinstance(workspace_data, WorkspaceData) else WorkspaceData.model_validate(workspace_data)
 
         #: Numeric ID of the workspace.
         self.id: int = data.id
@@ -28,36 +34,43 @@ class Workspace:
         #: True if at least one window in the workspace is in fullscreen mode.
         self.has_fullscreen: bool = data.has_fullscreen
 
+        #: The address of the most recently active window, parsed once since the workspace's data does not change.
+        self._last_window_address_as_int: int = int(self.last_window_address, 16)
+        #: The workspace's monitor, once it has been looked up through :attr:`~Workspace.monitor`.
+        self._monitor: Union['monitors.Monitor', None] = None
         #: The :class:`~hyprpy.components.instances.Instance` managing this workspace.
         self._instance = instance
 
 
     @property
     def monitor(self) -> 'monitors.Monitor':
-        """The :class:`~hyprpy.components.monitor.Monitor` this workspace is on."""
+        """The :class:`~hyprpy.components.monitor.Monitor` this workspace is on.
+
+        The monitor is looked up on first access only. Subsequent accesses return the same
+        :class:`~hyprpy.components.monitor.Monitor` object without querying Hyprland again.
+        """
 
-        monitor = self._instance.get_monitor_by_name(self.monitor_name)
-        if not monitor:
-            raise ParentNotFoundException(f"Parent monitor {self.monitor_name=!r} not found.")
-        return monitor
+        if self._monitor is None:
+            monitor = self._instance.get_monitor_by_name(self.monitor_name)
+            if not monitor:
+                raise ParentNotFoundException(f"Parent monitor {self.monitor_name=!r} not found.")
+            self._monitor = monitor
+        return self._monitor
 
 
     @property
     def windows(self) -> List['windows.Window']:
         """The list of all :class:`~hyprpy.components.window.Window`\\ s on this workspace."""
 
-        windows = []
-        for window in self._instance.get_windows():
-            if window.workspace_id == self.id:
-                windows.append(window)
-        return windows
+        self._instance.get_windows()
+        return list(self._instance._windows_by_workspace_id.get(self.id, []))
 
 
     @property
     def last_window_address_as_int(self) -> int:
         """The integer representation of the workspace's :attr:`~hyprpy.data.models.WorkspaceData.last_window_address` property."""
 
-        return int(self.last_window_address, 16)
+        return self._last_window_address_as_int
 
 
     def __repr__(self):
@@ -6,11 +6,16 @@ Classes:
     - :class:`WorkspaceData`: data for Hyprland workspaces.
     - :class:`MonitorData`: data for Hyprland monitors.
     - :class:`InstanceData`: data for Hyprland instances.
+
+Adapters:
+    - :data:`WINDOW_DATA_LIST_ADAPTER`: validates a list of :class:`WindowData`.
+    - :data:`WORKSPACE_DATA_LIST_ADAPTER`: validates a list of :class:`WorkspaceData`.
+    - :data:`MONITOR_DATA_LIST_ADAPTER`: validates a list of :class:`MonitorData`.
 """
 
-from typing import List
+from typing import List, Tuple
 
-from pydantic import BaseModel, Field, AliasPath
+from pydantic import BaseModel, Field, AliasPath, TypeAdapter
 
 from hyprpy.data.validators import HexString, NonEmptyString
 
@@ -106,7 +111,7 @@ class MonitorData(BaseModel):
     #: Assigned name of the workspace currently active on the monitor.
     active_workspace_name: str = Field(..., validation_alias=AliasPath("activeWorkspace", "name"))
     #: Unknown.
-    reserved: List[int]
+    reserved: Tuple[int, ...]
     #: Unknown.
     scale: float
     #: Unknown.
@@ -124,3 +129,11 @@ class InstanceData(BaseModel):
 
     #: `Instance signature <https://wiki.hyprland.org/IPC/#hyprland-instance-signature-his>`_ of the Hyprland instance.
     signature: NonEmptyString
+
+
+#: Validates the JSON array returned by ``hyprctl -j clients`` in a single pass through pydantic-core.
+WINDOW_DATA_LIST_ADAPTER: TypeAdapter[List[WindowData]] = TypeAdapter(List[WindowData])
+#: Validates the JSON array returned by ``hyprctl -j workspaces`` in a single pass through pydantic-core.
+WORKSPACE_DATA_LIST_ADAPTER: TypeAdapter[List[WorkspaceData]] = TypeAdapter(List[WorkspaceData])
+#: Validates the JSON array returned by ``hyprctl -j monitors`` in a single pass through pydantic-core.
+MONITOR_DATA_LIST_ADAPTER: TypeAdapter[List[MonitorData]] = TypeAdapter(List[MonitorData])
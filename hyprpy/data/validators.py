@@ -1,23 +1,40 @@
 """Custom validators used for type annotations and data model instance validation."""
 
+import re
+
 from typing_extensions import Annotated
 
-from pydantic import AfterValidator
+from pydantic import StringConstraints
 
 
 def non_empty_string(value: str) -> str:
-    """Ensures that ``value`` is a non-empty string."""
+    """Ensures that ``value`` is a non-empty string.
+
+    :data:`NonEmptyString` no longer uses this function. It is kept for compatibility with code which imports it.
+    """
 
     assert len(value) > 0, f"Expected a non-empty string."
     return value
 
-NonEmptyString = Annotated[str, AfterValidator(non_empty_string)]
+#: A string of length >= 1. The constraint is checked by pydantic-core, without calling back into python.
+NonEmptyString = Annotated[str, StringConstraints(min_length=1)]
+
+
+#: Matches string representations of hexadecimal numbers, optionally prefixed with ``0x``.
+#: Must be applied with :meth:`re.Pattern.fullmatch`, as it is not anchored.
+HEXADECIMAL_STRING_PATTERN = re.compile(r'(0[xX])?[0-9a-fA-F]+')
 
 
 def valid_hex_string(value: str) -> str:
-    """Ensures that ``value`` is a valid hexadecimal string."""
+    """Ensures that ``value`` is a valid hexadecimal string.
+
+    :data:`HexString` no longer uses this function. It is kept for compatibility with code which imports it.
+    """
 
-    int(value, 16)
+    if not HEXADECIMAL_STRING_PATTERN.fullmatch(value):
+        raise ValueError(f"Invalid characters in hexadecimal string: '{value}'")
     return value
 
-HexString = Annotated[str, AfterValidator(valid_hex_string), AfterValidator(non_empty_string)]
+#: A string representation of a hexadecimal number, optionally prefixed with ``0x``.
+#: The constraint is checked by pydantic-core, without calling back into python.
+HexString = Annotated[str, StringConstraints(pattern=rf'^{HEXADECIMAL_STRING_PATTERN.pattern}$')]
@@ -1,8 +1,15 @@
-"""Utility functions for type- and sanity checking."""
+"""Utility functions for type- and sanity checking.
 
-from typing import Any
+Type checks compare the exact type of the input first, and only fall back to :func:`isinstance`
+for subclasses, e.g. a ``bool`` passed where an ``int`` is expected.
+"""
+
+from types import FunctionType, MethodType
+from typing import Any, Tuple, Union
 import inspect
 
+from hyprpy.data.validators import HEXADECIMAL_STRING_PATTERN
+
 
 def assert_is_bool(value: Any) -> None:
     """Raises an exception if ``value`` is not a boolean.
@@ -11,7 +18,7 @@ def assert_is_bool(value: Any) -> None:
     :raises: :class:`TypeError` if ``value`` is not a boolean.
     """
 
-    if not isinstance(value, bool):
+    if type(value) is not bool:
         raise TypeError(f"Expected the input to be a bool but got a '{type(value)}'.")
 
 
@@ -22,7 +29,7 @@ def assert_is_int(value: Any) -> None:
     :raises: :class:`TypeError` if ``value`` is not a integer.
     """
 
-    if not isinstance(value, int):
+    if type(value) is not int and not isinstance(value, int):
         raise TypeError(f"Expected the input to be an integer but got a '{type(value)}'.")
 
 
@@ -33,7 +40,7 @@ def assert_is_float_or_int(value: Any) -> None:
     :raises: :class:`TypeError` if ``value`` is not a floating point number or an integer.
     """
 
-    if not (isinstance(value, int) or isinstance(value, float)):
+    if type(value) is not int and type(value) is not float and not isinstance(value, (int, float)):
         raise TypeError(f"Expected the input to be an integer or float, but got a '{type(value)}'.")
 
 
@@ -44,7 +51,7 @@ def assert_is_string(value: Any) -> None:
     :raises: :class:`TypeError` if ``value`` is not a string.
     """
 
-    if not isinstance(value, str):
+    if type(value) is not str and not isinstance(value, str):
         raise TypeError(f"Expected the input to be a string but got a '{type(value)}'.")
 
 
@@ -71,9 +78,7 @@ def assert_is_hexadecimal_string(value: Any) -> None:
     """
 
     assert_is_nonempty_string(value)
-    try:
-        int(value, 16)
-    except ValueError:
+    if not HEXADECIMAL_STRING_PATTERN.fullmatch(value):
         raise ValueError(f"Invalid characters in hexadecimal string: '{value}'")
 
 
@@ -98,6 +103,15 @@ def assert_is_callable_and_has_first_param_sender(value: Any) -> None:
 
     assert_is_callable(value)
 
+    func, is_method = _get_plain_function(value)
+    if func:
+        code = func.__code__
+        positional_params = code.co_varnames[int(is_method):code.co_argcount]
+        if positional_params:
+            if positional_params[0] != 'sender':
+                raise ValueError("Callable must accept 'sender' as the first parameter.")
+            return
+
     sig = inspect.signature(value)
     params = list(sig.parameters)
     
@@ -115,6 +129,12 @@ def assert_is_callable_and_accepts_kwargs(value: Any) -> None:
 
     assert_is_callable(value)
 
+    func, is_method = _get_plain_function(value)
+    if func and func.__code__.co_argcount > int(is_method):
+        if not func.__code__.co_flags & inspect.CO_VARKEYWORDS:
+            raise ValueError("Function must accept keyword arguments (**kwargs).")
+        return
+
     def _get_func_parameters(func, remove_first):
         parameters = tuple(inspect.signature(func).parameters.values())
         if remove_first:
@@ -128,3 +148,19 @@ def assert_is_callable_and_accepts_kwargs(value: Any) -> None:
 
     if not any(p for p in _get_callable_parameters(value) if p.kind == p.VAR_KEYWORD):
         raise ValueError("Function must accept keyword arguments (**kwargs).")
+
+
+def _get_plain_function(value: Any) -> Tuple[Union[FunctionType, None], bool]:
+    """Returns the python function underlying ``value``, and whether ``value`` is a bound method.
+
+    The parameters of plain python functions and bound methods can be read directly from the function's
+    code object, which is much faster than building an :class:`inspect.Signature`. For any other callable,
+    or for functions whose signature has been overridden (e.g. by :func:`functools.wraps`),
+    the returned function is ``None``.
+    """
+
+    is_method = type(value) is MethodType
+    func = value.__func__ if is_method else value
+    if type(func) is not FunctionType or hasattr(func, '__wrapped__') or hasattr(func, '__signature__'):
+        return None, is_method
+    return func, is_method
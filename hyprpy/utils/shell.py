@@ -45,6 +45,62 @@ def run_or_fail(command: list[str]) -> Tuple[str, str]:
     :raises: :class:`ValueError` if ``command`` is an empty list.
     """
 
+    _assert_is_command(command)
+
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=True)
+    except subprocess.SubprocessError as e:
+        raise NonZeroStatusException(str(e))
+
+    return (result.stdout, result.stderr)
+
+
+def run_in_background(command: list[str]) -> subprocess.Popen:
+    """Starts the specified ``command`` and returns without waiting for it to finish.
+
+    Contrary to :func:`run_or_fail`, the command's output is discarded and its exit status is not checked.
+    This makes the function suitable for use in signal callbacks, where waiting for the command would hold up
+    :meth:`~hyprpy.components.instances.Instance.watch` until the command has finished.
+
+    The started process is not reaped by this function. Keep the returned :class:`subprocess.Popen` object
+    and call its :meth:`~subprocess.Popen.poll` or :meth:`~subprocess.Popen.wait` method once the process
+    may have finished. Otherwise, the finished process lingers as a zombie, and Python emits a
+    :class:`ResourceWarning` when the object is discarded while the process is still running.
+
+    Example:
+
+    .. code-block:: python
+
+        from hyprpy.utils.shell import run_in_background
+
+        processes = []
+
+        def workspace_changed(sender, **kwargs):
+            # Reap the processes started by earlier calls which have finished by now
+            processes[:] = [process for process in processes if process.poll() is None]
+            processes.append(run_in_background(['notify-send', 'Workspace Changed']))
+
+    :param command: The command to run, as a list of string tokens.
+    :return: The :class:`subprocess.Popen` object of the started process, which the caller must reap.
+    :raises: :class:`TypeError` if ``command`` is not a list of strings.
+    :raises: :class:`ValueError` if ``command`` is an empty list.
+    """
+
+    _assert_is_command(command)
+    return subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _assert_is_command(command: list[str]) -> None:
+    """Raises an exception if ``command`` is not a non-empty list of string tokens.
+
+    :raises: :class:`TypeError` if ``command`` is not a list of strings.
+    :raises: :class:`ValueError` if ``command`` is an empty list.
+    """
+
+    if type(command) is list and command and all(type(token) is str for token in command):
+        return
+
+    # Find out what is wrong with the command, to raise the appropriate exception
     if not isinstance (command, list):
         log.error(f"Failed to parse command: {command}")
         raise TypeError("Command must be a list of string tokens.")
@@ -56,13 +112,6 @@ def run_or_fail(command: list[str]) -> Tuple[str, str]:
         log.error(f"Failed to parse command: {command}")
         raise ValueError("Command cannot be without tokens.")
 
-    try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-    except subprocess.SubprocessError as e:
-        raise NonZeroStatusException(str(e))
-
-    return (result.stdout, result.stderr)
-
 
 def get_env_var_or_fail(name: str) -> str:
     """Retrieves the value of the environment variable ``name`` or raises an exception if it is undefined.
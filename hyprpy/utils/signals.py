@@ -29,7 +29,7 @@ Example:
 
 """
 
-from typing import Callable, List
+from typing import Callable, Dict
 
 from hyprpy.utils import assertions
 
@@ -58,7 +58,8 @@ class Signal():
     """
 
     def __init__(self, sender: object):
-        self._observers: List[Callable] = []
+        #: The connected callbacks, in the order they were connected. Only the keys are used.
+        self._observers: Dict[Callable, None] = {}
         self._sender = sender
 
 
@@ -66,10 +67,11 @@ class Signal():
         """Connects the specified ``callback`` to this :class:`Signal`.
 
         The callback signature **must** contain ``sender`` as the positional argument,
-        followed by ``**kwargs``.
+        followed by ``**kwargs``. Connecting a callback which is already connected has no effect.
+        The callback must be hashable, which plain functions, methods and lambdas always are.
 
         :param callback: The callback function to be connected to this signal.
-        :raises: :class:`TypeError` if ``callback`` is not callable.
+        :raises: :class:`TypeError` if ``callback`` is not callable, or not hashable.
         :raises: :class:`ValueError` if the first positional argument of ``callback`` is not ``sender``.
         :raises: :class:`ValueError` if ``callback`` does not accept keyword arguments.
 
@@ -86,7 +88,10 @@ class Signal():
         assertions.assert_is_callable_and_has_first_param_sender(callback)
         assertions.assert_is_callable_and_accepts_kwargs(callback)
 
-        self._observers.append(callback)
+        try:
+            self._observers[callback] = None
+        except TypeError:
+            raise TypeError(f"Callback must be hashable, but '{type(callback)}' is not.") from None
 
 
     def disconnect(self, callback: Callable) -> None:
@@ -111,7 +116,10 @@ class Signal():
             signal.disconnect(my_callback)
         """
 
-        self._observers.remove(callback)
+        try:
+            del self._observers[callback]
+        except KeyError:
+            raise ValueError("Attempted to disconnect a callback which is not connected.") from None
 
 
     def emit(self, **kwargs) -> None:
@@ -134,5 +142,7 @@ class Signal():
             obj.signal.emit(message="Hello from sender!")
         """
 
-        for callback in self._observers:
-            callback(self._sender, **kwargs)
+        sender = self._sender
+        # Iterate over a snapshot, so that callbacks may disconnect themselves
+        for callback in tuple(self._observers):
+            callback(sender, **kwargs)
@@ -28,12 +28,16 @@ Examples:
     instance.command_socket.send_command("dispatch", flags=["--single-instance"], args=["exec", "kitty"])
 """
 
-from abc import ABC
-from os import getenv
-from pathlib import PosixPath
-from typing import List
+from functools import lru_cache
+from itertools import chain
+from os import getenv, path, stat as os_stat
+from stat import S_ISSOCK
+from typing import List, Tuple
+import asyncio
+import codecs
 import logging
-import select, socket
+import socket
+import struct
 
 from hyprpy.utils import assertions
 
@@ -46,7 +50,16 @@ class SocketError(Exception):
     pass
 
 
-class AbstractSocket(ABC):
+def _is_socket(path_to_file: str) -> bool:
+    """Returns ``True`` if ``path_to_file`` points to an existing UNIX socket file, ``False`` otherwise."""
+
+    try:
+        return S_ISSOCK(os_stat(path_to_file).st_mode)
+    except OSError:
+        return False
+
+
+class AbstractSocket:
     """Base class for concrete socket classes.
 
     Provides attributes and methods common between :class:`~EventSocket`
@@ -63,13 +76,21 @@ class AbstractSocket(ABC):
         #: The Hyprland Instance Signature.
         self._signature: str = signature
         #: Filesystem path to the socket file.
-        self._path_to_socket: PosixPath
+        self._path_to_socket: str
         #: The underlying :class:`socket.socket` object.
         self._socket: socket.socket | None = None
+        #: Buffer which incoming data is received into. It is reused across reads and grows as needed.
+        self._read_buffer: bytearray = bytearray(65536)
+        #: Number of bytes received into the read buffer by :meth:`~AbstractSocket.wait` which have not been retrieved by :meth:`~AbstractSocket.read` yet.
+        self._read_length: int = 0
+        #: The receive timeout (``SO_RCVTIMEO``) currently configured on the :class:`~socket.socket`.
+        self._receive_timeout: int | float | None = None
+        #: Decodes received data, holding back a multi-byte character split across two reads until it is complete.
+        self._decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder('UTF-8')()
 
 
     @staticmethod
-    def _find_socket_base_directory() -> PosixPath:
+    def _find_socket_base_directory() -> str:
         """Finds the filesystem directory where the Hyprland socket files are located.
 
         On older versions of Hyprland (pre v0.40.0), the base directory for socket files is located
@@ -84,12 +105,12 @@ class AbstractSocket(ABC):
         """
 
         runtime_dir = getenv("XDG_RUNTIME_DIR", None)
-        base_dir_legacy = PosixPath("/tmp/hypr")
-        base_dir_newer = PosixPath(runtime_dir) / "hypr" if runtime_dir else None
+        base_dir_legacy = "/tmp/hypr"
+        base_dir_newer = path.join(runtime_dir, "hypr") if runtime_dir else None
 
-        if base_dir_newer and base_dir_newer.is_dir():
+        if base_dir_newer and path.isdir(base_dir_newer):
             return base_dir_newer
-        if base_dir_legacy.is_dir():
+        if path.isdir(base_dir_legacy):
             return base_dir_legacy
         if not base_dir_newer:
             raise RuntimeError(
@@ -107,8 +128,9 @@ class AbstractSocket(ABC):
         specified ``timeout`` period, a :class:`SocketError` is raised. The default
         ``timeout`` is 1 second.
 
-        Once created, the :class:`~socket.socket` is put into non-blocking mode (regardless
-        of the specified ``timeout``).
+        Once connected, the :class:`~socket.socket` is put into blocking mode (regardless
+        of the specified ``timeout``). Reads which must not block are done without
+        switching the socket's mode.
 
         :param timeout: Maximum number of seconds to wait for a connection to be established until
             a :class:`~SocketError` is raised. If ``timeout`` is ``None``, the call blocks indefinitely
@@ -124,8 +146,9 @@ class AbstractSocket(ABC):
 
         self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         self._socket.settimeout(timeout)
-        self._socket.connect(str(self._path_to_socket))
-        self._socket.setblocking(False)
+        self._socket.connect(self._path_to_socket)
+        self._socket.settimeout(None)
+        self._receive_timeout = None
 
 
     def close(self) -> None:
@@ -138,43 +161,65 @@ class AbstractSocket(ABC):
             raise SocketError("Attempted to close a socket which was not created.")
         self._socket.close()
         self._socket = None
+        self._read_length = 0
+        self._decoder.reset()
 
 
-    def send(self, data: str) -> None:
+    def send(self, data: str | bytes) -> None:
         """Sends ``data`` into the :class:`~socket.socket`.
 
+        Strings are encoded as UTF-8 before being sent.
+
         :raises: :class:`~SocketError` if the :class:`~socket.socket` is not connected.
+        :raises: :class:`TypeError` if ``data`` is neither a string nor bytes.
         """
 
         if not self._socket:
             raise SocketError("Attempted to send data to a socket which was not connected.")
-        assertions.assert_is_string(data)
+        if not isinstance(data, bytes):
+            assertions.assert_is_string(data)
+            data = data.encode('UTF-8')
 
-        self._socket.sendall(data.encode('UTF-8'))
+        self._socket.sendall(data)
 
 
     def wait(self, timeout: int | float | None = None) -> None:
         """Waits a maximum of ``timeout`` seconds until data has arrived at the :class:`~socket.socket`.
 
         Calling this method avoids using active waiting to wait for socket data.
+        The data which has arrived is received right away and handed out by the next call to
+        :meth:`~AbstractSocket.read`, so that waiting and reading takes no extra system call.
 
         :param timeout: The maximum number of seconds to wait for data until a :class:`~SocketError` is raised.
             If ``timeout`` is ``None``, wait indefinitely until data is ready to be retrieved.
-        :raises: :class:`~SocketError` if the :class:`~socket.socket` is not connected, or if the specified
-            ``timeout`` was reached..
+        :raises: :class:`~SocketError` if the :class:`~socket.socket` is not connected, if the specified
+            ``timeout`` was reached, or if the connection has been closed by the other end.
         """
 
         if not self._socket:
             raise SocketError("Attempted to wait for data on a socket which was not connected.")
 
-        read_ready, _, _ = select.select([self._socket], [], [], timeout)
-        if not read_ready:
+        if self._read_length:
+            return
+
+        try:
+            if timeout is not None and timeout <= 0:
+                self._read_length = self._socket.recv_into(self._read_buffer, 0, socket.MSG_DONTWAIT)
+            else:
+                self._set_receive_timeout(timeout)
+                self._read_length = self._socket.recv_into(self._read_buffer)
+        except BlockingIOError:
             raise SocketError(f"Waiting socket timed out after {timeout} seconds.")
+        if not self._read_length:
+            raise SocketError("The socket was closed by the other end.")
 
 
     def read(self) -> str:
         """Immediately retrieves all data from the :class:`~socket.socket` and returns it.
 
+        If the received data ends within a multi-byte UTF-8 character, the incomplete character
+        is held back and returned at the start of the next read.
+
         :return: The data received from the :class:`~socket.socket` as a string. If the socket
             does not contain any data, returns an empty string.
         :raises: :class:`~SocketError` if the :class:`~socket.socket` is not connected.
@@ -183,21 +228,41 @@ class AbstractSocket(ABC):
         if not self._socket:
             raise SocketError("Attempted to receive data from a socket which was not connected.")
 
-        data = bytearray()
+        buffer = self._read_buffer
+        length = self._read_length
+        self._read_length = 0
         while True:
+            if length == len(buffer):
+                buffer.extend(bytes(length))
             try:
-                data_chunk = self._socket.recv(4096)
-                if data_chunk:
-                    data += data_chunk
-                else:
-                    break
-            except BlockingIOError as e:
-                if e.errno == 11:
-                    break
-                else:
-                    raise SocketError(f"Failed to read from socket: {e}")
+                received = self._socket.recv_into(memoryview(buffer)[length:], 0, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                break
+            if not received:
+                break
+            length += received
+
+        return self._decoder.decode(memoryview(buffer)[:length])
+
+
+    def _set_receive_timeout(self, timeout: int | float | None) -> None:
+        """Configures the kernel-side receive timeout (``SO_RCVTIMEO``) of the :class:`~socket.socket`.
 
-        return data.decode('UTF-8')
+        Blocking receives time out after ``timeout`` seconds, or never if ``timeout`` is ``None``.
+        The socket option is only set if ``timeout`` differs from the currently configured value.
+        """
+
+        if timeout == self._receive_timeout:
+            return
+        if timeout is None:
+            seconds, microseconds = 0, 0
+        else:
+            assertions.assert_is_float_or_int(timeout)
+            # A zero timeval disables the timeout, so round tiny timeouts up to one microsecond
+            seconds, microseconds = divmod(max(int(timeout * 1_000_000), 1), 1_000_000)
+
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, struct.pack('ll', seconds, microseconds))
+        self._receive_timeout = timeout
 
 
 class EventSocket(AbstractSocket):
@@ -210,11 +275,74 @@ class EventSocket(AbstractSocket):
     def __init__(self, signature: str):
         super().__init__(signature)
 
-        socket_base_dir = self._find_socket_base_directory()
-        self._path_to_socket = socket_base_dir /self._signature / ".socket2.sock"
-        if not self._path_to_socket.is_socket():
+        self._path_to_socket = path.join(self._find_socket_base_directory(), self._signature, ".socket2.sock")
+        if not _is_socket(self._path_to_socket):
             raise FileNotFoundError(f"No socket found at {self._path_to_socket!r}.")
 
+        #: Stream reader and writer wrapping the :class:`~socket.socket` while it is read from asynchronously.
+        self._stream: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None
+
+
+    def close(self) -> None:
+        """Disconnects and closes the :class:`~socket.socket`, along with the stream created by :meth:`~EventSocket.aread`.
+
+        :raises: :class:`~SocketError` if the :class:`~socket.socket` has already been disconnected.
+        """
+
+        if self._stream:
+            _, stream_writer = self._stream
+            stream_writer.close()
+            self._stream = None
+        super().close()
+
+
+    async def aread(self) -> str:
+        """Asynchronously waits until data has arrived at the :class:`~socket.socket`, then retrieves it and returns it.
+
+        This is the :mod:`asyncio` counterpart to calling :meth:`~AbstractSocket.wait` followed by
+        :meth:`~AbstractSocket.read`. It must be awaited from within a running event loop, which takes
+        over the :class:`~socket.socket` until it is closed. Like :meth:`~AbstractSocket.read`, it holds back
+        a multi-byte UTF-8 character split across two reads until the character is complete.
+
+        Data which has already been received by :meth:`~AbstractSocket.wait` is returned right away.
+
+        :return: The data received from the :class:`~socket.socket` as a string.
+        :raises: :class:`~SocketError` if the :class:`~socket.socket` is not connected, or if Hyprland
+            has closed the connection.
+        """
+
+        if not self._socket:
+            raise SocketError("Attempted to receive data from a socket which was not connected.")
+
+        if self._read_length:
+            length = self._read_length
+            self._read_length = 0
+            return self._decoder.decode(memoryview(self._read_buffer)[:length])
+
+        if not self._stream:
+            self._stream = await asyncio.open_unix_connection(sock=self._socket)
+        stream_reader, _ = self._stream
+        data = await stream_reader.read(len(self._read_buffer))
+        if not data:
+            raise SocketError("The event socket was closed by Hyprland.")
+        return self._decoder.decode(data)
+
+
+#: Prefix which marks a message sent through the :class:`CommandSocket` as a batch of several commands.
+_BATCH_PREFIX = b"[[BATCH]]"
+#: Separator between the responses to the commands in a batch.
+_BATCH_RESPONSE_SEPARATOR = "\n\n\n"
+
+
+@lru_cache(maxsize=64)
+def _encode_command_prefix(command: str, flags: Tuple[str, ...]) -> bytes:
+    """Returns the encoded ``flags/command`` part of a message sent through the :class:`CommandSocket`.
+
+    Commands are usually sent with the same few flags over and over, so the encoded result is cached.
+    """
+
+    return (" ".join(flags) + "/" + command).encode('UTF-8')
+
 
 class CommandSocket(AbstractSocket):
     """Interface to Hyprland's command socket.
@@ -226,9 +354,8 @@ class CommandSocket(AbstractSocket):
     def __init__(self, signature: str):
         super().__init__(signature)
 
-        socket_base_dir = self._find_socket_base_directory()
-        self._path_to_socket = socket_base_dir / self._signature / ".socket.sock"
-        if not self._path_to_socket.is_socket():
+        self._path_to_socket = path.join(self._find_socket_base_directory(), self._signature, ".socket.sock")
+        if not _is_socket(self._path_to_socket):
             raise FileNotFoundError(f"No socket found at {self._path_to_socket!r}.")
 
 
@@ -246,7 +373,8 @@ class CommandSocket(AbstractSocket):
         :param flags: Any flags to accompany the command.
         :param args: Arguments for the command.
         :return: Response from the socket.
-        :raises: :class:`~SocketError` if the :class:`~socket.socket` is already connected.
+        :raises: :class:`~SocketError` if the :class:`~socket.socket` is already connected, or if
+            Hyprland does not respond in time.
         :raises: :class:`TypeError` if ``command`` or any items in ``flags`` and ``args``
             are not strings.
         :raises: :class:`ValueError` if ``command`` or any items in ``flags`` and ``args``
@@ -261,16 +389,115 @@ class CommandSocket(AbstractSocket):
         """
 
         assertions.assert_is_nonempty_string(command)
-        for token in args + flags:
-            assertions.assert_is_nonempty_string(token)
+        if not all(isinstance(token, str) and token for token in chain(flags, args)):
+            # Let the assertions raise the appropriate exception for the offending token
+            for token in chain(flags, args):
+                assertions.assert_is_nonempty_string(token)
 
-        message = " ".join(flags) + "/" + command
+        message_parts = [_encode_command_prefix(command, tuple(flags))]
         if args:
-            message += " " + " ".join(args)
+            message_parts.append((" " + " ".join(args)).encode('UTF-8'))
 
         self.connect()
-        self.send(message)
-        self.wait(0.5)
-        response = self.read()
-        self.close()
+        try:
+            self._send_message_parts(message_parts)
+            response = self._receive_response(timeout=0.5)
+        finally:
+            self.close()
         return response
+
+
+    def send_commands(self, commands: List[str], flags: List[str] = []) -> List[str]:
+        """Sends several commands through the socket at once and returns the received responses.
+
+        The commands are sent as a single batch, using the same connection to Hyprland, and
+        the responses are returned in the order of ``commands``. Like :meth:`~CommandSocket.send_command`,
+        this method implicitly connects the socket and disconnects it afterwards.
+
+        Each command is given as a single string, including its arguments, e.g. ``"dispatch workspace 3"``.
+        The ``flags`` are applied to every command in the batch.
+
+        :param commands: The command strings.
+        :param flags: Any flags to accompany the commands.
+        :return: The responses from the socket, one for each command.
+        :raises: :class:`~SocketError` if the :class:`~socket.socket` is already connected, if
+            Hyprland does not respond in time, or if its response cannot be split into one response per command.
+        :raises: :class:`TypeError` if ``commands`` is a single string rather than a list of strings,
+            or if any items in ``commands`` or ``flags`` are not strings.
+        :raises: :class:`ValueError` if ``commands`` is empty, if any items in ``commands`` or ``flags``
+            are empty strings, or if a command contains a ``;``.
+
+        Example:
+
+        .. code-block:: python
+
+            clients, monitors = command_socket.send_commands(["clients", "monitors"], flags=["-j"])
+        """
+
+        if isinstance(commands, str):
+            raise TypeError(f"Commands must be given as a list of strings, not as a single string: '{commands}'")
+        if not commands:
+            raise ValueError("At least one command must be specified.")
+        for token in chain(commands, flags):
+            assertions.assert_is_nonempty_string(token)
+        for command in commands:
+            if ";" in command:
+                raise ValueError(f"Batched commands cannot contain ';': '{command}'")
+
+        flags = tuple(flags)
+        message = b";".join(_encode_command_prefix(command, flags) for command in commands)
+
+        self.connect()
+        try:
+            self._send_message_parts([_BATCH_PREFIX, message])
+            response = self._receive_response(timeout=0.5)
+        finally:
+            self.close()
+
+        responses = response.split(_BATCH_RESPONSE_SEPARATOR)
+        if len(responses) != len(commands):
+            raise SocketError(
+                f"Expected {len(commands)} responses to the batched commands, but got {len(responses)}."
+            )
+        return responses
+
+
+    def _send_message_parts(self, message_parts: List[bytes]) -> None:
+        """Sends the concatenation of ``message_parts`` into the connected :class:`~socket.socket`.
+
+        The parts are handed to the kernel as separate buffers, so they are never joined in memory
+        unless the kernel accepts only part of the message.
+        """
+
+        sent = self._socket.sendmsg(message_parts)
+        if sent < sum(len(part) for part in message_parts):
+            self._socket.sendall(b''.join(message_parts)[sent:])
+
+
+    def _receive_response(self, timeout: int | float) -> str:
+        """Receives the complete response to a command which has been sent, and returns it.
+
+        Hyprland closes the connection once it has written its response, so data is received
+        until the end of the stream is reached. Each receive blocks until the read buffer is full or
+        the stream has ended, so that most responses arrive in a single system call.
+
+        :param timeout: The maximum number of seconds to wait for each chunk of the response.
+        :return: The response as a string.
+        :raises: :class:`~SocketError` if no data arrives within ``timeout`` seconds.
+        """
+
+        self._set_receive_timeout(timeout)
+        buffer = self._read_buffer
+        length = 0
+        while True:
+            if length == len(buffer):
+                buffer.extend(bytes(length))
+            try:
+                received = self._socket.recv_into(memoryview(buffer)[length:], 0, socket.MSG_WAITALL)
+            except BlockingIOError:
+                raise SocketError(f"Waiting for a response timed out after {timeout} seconds.")
+            if not received:
+                break
+            length += received
+
+        return str(memoryview(buffer)[:length], 'UTF-8')
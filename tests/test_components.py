@@ -0,0 +1,25 @@
+"""Tests for the :class:`~hyprpy.components.windows.Window`, :class:`~hyprpy.components.workspaces.Workspace`
+and :class:`~hyprpy.components.monitors.Monitor` components."""
+
+import unittest
+import weakref
+
+from tests.test_instances import FakeHyprlandTestCase
+
+
+class TestComponents(FakeHyprlandTestCase):
+
+    def test_components_support_weak_references(self):
+        components = (
+            self.instance.get_windows()[0],
+            self.instance.get_workspaces()[0],
+            self.instance.get_monitors()[0],
+        )
+
+        for component in components:
+            with self.subTest(component=component):
+                self.assertIs(weakref.ref(component)(), component)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,378 @@
+"""Tests for :class:`hyprpy.components.instances.Instance` against fake Hyprland sockets."""
+
+from unittest import mock
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from hyprpy.components.instances import Instance
+from hyprpy.utils.sockets import SocketError
+
+
+SIGNATURE = "test_signature"
+
+
+def window_json(address, workspace_id=1):
+    return {
+        "address": address, "mapped": True, "hidden": False, "at": [0, 0], "size": [800, 600],
+        "workspace": {"id": workspace_id, "name": str(workspace_id)}, "floating": False, "monitor": 0,
+        "class": "kitty", "title": "fish", "initialClass": "kitty", "initialTitle": "fish", "pid": 1000,
+        "xwayland": False, "pinned": False, "fullscreen": 0, "grouped": [], "swallowing": "0x0",
+    }
+
+
+def workspace_json(id, monitor_name="DP-1"):
+    return {
+        "id": id, "name": str(id), "monitor": monitor_name, "monitorID": 0, "windows": 1,
+        "hasfullscreen": False, "lastwindow": "0x1001", "lastwindowtitle": "fish",
+    }
+
+
+def monitor_json(id, name):
+    return {
+        "id": id, "name": name, "description": "", "make": "", "model": "", "serial": "",
+        "width": 1920, "height": 1080, "refreshRate": 60.0, "x": 0, "y": 0,
+        "activeWorkspace": {"id": 1, "name": "1"}, "specialWorkspace": {"id": 0, "name": ""},
+        "reserved": [0, 0, 0, 0], "scale": 1.0, "transform": 0, "focused": True,
+        "dpmsStatus": True, "vrr": False,
+    }
+
+
+class StopWatching(Exception):
+    """Raised from a callback to end :meth:`Instance.watch`."""
+    pass
+
+
+class FakeHyprlandTestCase(unittest.TestCase):
+    """Provides an :class:`Instance` connected to fake command and event sockets.
+
+    The fake command socket answers each request with the reply stored for it in ``self.command_replies``,
+    or with ``ok`` if there is none. A reply may be a tuple of parts, which are sent in separate writes.
+    All requests received are recorded in ``self.command_requests``.
+
+    The fake event socket accepts a single connection, which is available as ``self.event_connection``
+    once :meth:`accept_event_connection` returns.
+    """
+
+    def setUp(self):
+        self._runtime_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._runtime_dir.cleanup)
+        socket_dir = os.path.join(self._runtime_dir.name, "hypr", SIGNATURE)
+        os.makedirs(socket_dir)
+
+        self._servers = []
+        for socket_name in (".socket.sock", ".socket2.sock"):
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(os.path.join(socket_dir, socket_name))
+            server.listen(1)
+            self.addCleanup(server.close)
+            self._servers.append(server)
+        self._event_server = self._servers[1]
+        self.event_connection = None
+
+        self.command_replies = {
+            "-j/clients": json.dumps([window_json("0x1001"), window_json("0x1002", workspace_id=2)]).encode(),
+            "-j/workspaces": json.dumps([workspace_json(1), workspace_json(2)]).encode(),
+            "-j/monitors": json.dumps([monitor_json(0, "DP-1")]).encode(),
+        }
+        self.command_requests = []
+        self._stop_serving = threading.Event()
+        command_server = threading.Thread(target=self._serve_commands, daemon=True)
+        command_server.start()
+        self.addCleanup(command_server.join)
+        self.addCleanup(self._stop_serving.set)
+
+        environment = mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": self._runtime_dir.name})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        self.instance = Instance(SIGNATURE)
+
+
+    def _serve_commands(self):
+        command_server = self._servers[0]
+        command_server.settimeout(0.05)
+        while not self._stop_serving.is_set():
+            try:
+                connection, _ = command_server.accept()
+            except socket.timeout:
+                continue
+            with connection:
+                request = connection.recv(65536).decode()
+                self.command_requests.append(request)
+                reply = self.command_replies.get(request, b"ok")
+                for part in reply if isinstance(reply, tuple) else (reply,):
+                    connection.sendall(part)
+                    if isinstance(reply, tuple):
+                        time.sleep(0.01)
+
+
+    def accept_event_connection(self):
+        self._event_server.settimeout(5)
+        self.event_connection, _ = self._event_server.accept()
+        self.addCleanup(self.event_connection.close)
+
+
+    def send_events_in_parts(self, *parts):
+        """Accepts the event socket connection, then sends each of ``parts`` in a separate write."""
+
+        self.accept_event_connection()
+        for part in parts:
+            self.event_connection.sendall(part)
+            # Give the reader time to receive each part on its own
+            time.sleep(0.1)
+
+
+class TestWatch(FakeHyprlandTestCase):
+
+    # The event is split in the middle of the line, and within the two-byte 'é' of the window title
+    EVENT_PARTS = (b"openwindow>>80e62df0,2,kitty,caf\xc3", b"\xa9\n")
+
+    def test_event_and_character_split_across_reads(self):
+        received = []
+
+        def window_created(sender, **kwargs):
+            received.append(kwargs['created_window_address'])
+            raise StopWatching()
+
+        self.instance.signal_window_created.connect(window_created)
+        sender = threading.Thread(target=self.send_events_in_parts, args=self.EVENT_PARTS)
+        sender.start()
+        try:
+            with self.assertRaises(StopWatching):
+                self.instance.watch()
+        finally:
+            sender.join()
+
+        self.assertEqual(received, ['80e62df0'])
+
+
+    def test_event_and_character_split_across_async_reads(self):
+        received = []
+
+        def window_created(sender, **kwargs):
+            received.append(kwargs['created_window_address'])
+            raise StopWatching()
+
+        self.instance.signal_window_created.connect(window_created)
+
+        async def watch():
+            sender = asyncio.get_running_loop().run_in_executor(None, self.send_events_in_parts, *self.EVENT_PARTS)
+            try:
+                with self.assertRaises(StopWatching):
+                    await asyncio.wait_for(self.instance.awatch(), 5)
+            finally:
+                await sender
+
+        asyncio.run(watch())
+        self.assertEqual(received, ['80e62df0'])
+
+
+    def test_watch_ends_when_event_socket_is_closed(self):
+        raised = []
+
+        def watch():
+            try:
+                self.instance.watch()
+            except Exception as exception:
+                raised.append(exception)
+
+        # Watch in a separate thread, so that the test fails instead of hanging if watch() never returns
+        watcher = threading.Thread(target=watch, daemon=True)
+        watcher.start()
+        self.close_event_connection()
+        watcher.join(5)
+
+        self.assertFalse(watcher.is_alive())
+        self.assertEqual(len(raised), 1)
+        self.assertIsInstance(raised[0], SocketError)
+
+
+    def test_async_watch_ends_when_event_socket_is_closed(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0.01)
+
+        async def watch():
+            ticker = asyncio.create_task(tick())
+            closer = asyncio.get_running_loop().run_in_executor(None, self.close_event_connection)
+            try:
+                with self.assertRaises(SocketError):
+                    await asyncio.wait_for(self.instance.awatch(), 5)
+            finally:
+                await closer
+                ticker.cancel()
+
+        asyncio.run(watch())
+        # The event loop kept running other tasks while the closed socket was being watched
+        self.assertGreater(len(ticks), 1)
+
+
+    def close_event_connection(self):
+        self.accept_event_connection()
+        time.sleep(0.1)
+        self.event_connection.close()
+
+
+class TestCache(FakeHyprlandTestCase):
+
+    def test_components_are_reused_within_cache_ttl(self):
+        self.instance.cache_ttl = 60
+
+        windows = self.instance.get_windows()
+
+        self.assertEqual(self.instance.get_windows(), windows)
+        self.assertEqual(self.command_requests, ["-j/clients"])
+
+
+    def test_components_are_retrieved_again_once_cache_ttl_expires(self):
+        self.instance.cache_ttl = 0.05
+
+        self.instance.get_windows()
+        time.sleep(0.1)
+        self.instance.get_windows()
+
+        self.assertEqual(self.command_requests, ["-j/clients", "-j/clients"])
+
+
+    def test_components_are_retrieved_again_after_an_event(self):
+        self.instance.cache_ttl = 60
+
+        self.instance.get_windows()
+        self.instance._handle_socket_data("workspace>>2")
+        self.instance.get_windows()
+
+        self.assertEqual(self.command_requests, ["-j/clients", "-j/clients"])
+
+
+    def test_components_are_retrieved_again_after_dispatching(self):
+        self.instance.cache_ttl = 60
+
+        self.instance.get_windows()
+        self.instance.dispatch(["workspace", "2"])
+        self.instance.get_windows()
+
+        self.assertEqual(self.command_requests, ["-j/clients", "-j/dispatch workspace 2", "-j/clients"])
+
+
+    def test_components_are_not_cached_by_default(self):
+        self.instance.get_windows()
+        self.instance.get_windows()
+
+        self.assertEqual(self.command_requests, ["-j/clients", "-j/clients"])
+
+
+class TestBatchRequests(FakeHyprlandTestCase):
+
+    BATCH_REQUEST = "[[BATCH]]-j/clients;-j/workspaces;-j/monitors"
+
+    def setUp(self):
+        super().setUp()
+        self.command_replies[self.BATCH_REQUEST] = b"\n\n\n".join((
+            self.command_replies["-j/clients"],
+            self.command_replies["-j/workspaces"],
+            self.command_replies["-j/monitors"],
+        ))
+
+
+    def test_send_commands_sends_a_single_batch_request(self):
+        self.instance.command_socket.send_commands(["clients", "workspaces", "monitors"], flags=["-j"])
+
+        self.assertEqual(self.command_requests, [self.BATCH_REQUEST])
+
+
+    def test_send_commands_splits_the_response_per_command(self):
+        self.command_replies["[[BATCH]]/dispatch workspace 2;/keyword general:border_size 2"] = b"ok\n\n\nok"
+
+        responses = self.instance.command_socket.send_commands(
+            ["dispatch workspace 2", "keyword general:border_size 2"]
+        )
+
+        self.assertEqual(responses, ["ok", "ok"])
+
+
+    def test_send_commands_rejects_a_response_with_the_wrong_number_of_parts(self):
+        self.command_replies["[[BATCH]]/dispatch workspace 2;/dispatch workspace 3"] = b"ok"
+
+        with self.assertRaises(SocketError):
+            self.instance.command_socket.send_commands(["dispatch workspace 2", "dispatch workspace 3"])
+
+
+    def test_send_commands_rejects_a_single_string(self):
+        with self.assertRaises(TypeError):
+            self.instance.command_socket.send_commands("clients")
+        self.assertEqual(self.command_requests, [])
+
+
+    def test_refresh_all(self):
+        windows, workspaces, monitors = self.instance.refresh_all()
+
+        self.assertEqual(self.command_requests, [self.BATCH_REQUEST])
+        self.assertEqual([window.address for window in windows], ["0x1001", "0x1002"])
+        self.assertEqual([workspace.id for workspace in workspaces], [1, 2])
+        self.assertEqual([monitor.name for monitor in monitors], ["DP-1"])
+
+
+    def test_refresh_all_keeps_previous_state_if_a_response_is_invalid(self):
+        self.instance.refresh_all()
+        windows_by_address = self.instance._windows_by_address
+        workspaces_by_id = self.instance._workspaces_by_id
+        self.command_replies[self.BATCH_REQUEST] = b"\n\n\n".join((
+            json.dumps([window_json("0x2001")]).encode(),
+            b'[{"id": "not a workspace"}]',
+            self.command_replies["-j/monitors"],
+        ))
+
+        with self.assertRaises(ValueError):
+            self.instance.refresh_all()
+
+        self.assertIs(self.instance._windows_by_address, windows_by_address)
+        self.assertIs(self.instance._workspaces_by_id, workspaces_by_id)
+        self.assertEqual(list(self.instance._windows_by_address), [0x1001, 0x1002])
+
+
+class TestGetWindowByAddress(FakeHyprlandTestCase):
+
+    def test_rejects_what_hex_string_rejects(self):
+        for address in (" 0x1001 ", "+1001", "10_01", "0x", "0x1001\n"):
+            with self.subTest(address=address):
+                with self.assertRaises(ValueError):
+                    self.instance.get_window_by_address(address)
+
+
+class TestCommandSocket(FakeHyprlandTestCase):
+
+    def test_send_command_returns_response_larger_than_read_buffer(self):
+        # More than 64 KiB in total, written in several parts, with a two-byte 'é' straddling the first boundary
+        parts = (b"a" * 40000 + b"\xc3", b"\xa9" + b"b" * 40000, b"c" * 40000)
+        self.command_replies["/version"] = parts
+
+        response = self.instance.command_socket.send_command("version")
+
+        self.assertEqual(self.command_requests, ["/version"])
+        self.assertEqual(response, b"".join(parts).decode())
+
+
+class TestEventSocket(FakeHyprlandTestCase):
+
+    def test_async_read_returns_data_received_by_wait(self):
+        event_socket = self.instance.event_socket
+        event_socket.connect()
+        self.addCleanup(event_socket.close)
+        self.accept_event_connection()
+        self.event_connection.sendall(b"workspace>>2\n")
+        event_socket.wait(timeout=5)
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(event_socket.aread(), 5)), "workspace>>2\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
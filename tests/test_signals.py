@@ -0,0 +1,48 @@
+"""Tests for :class:`hyprpy.utils.signals.Signal`."""
+
+from dataclasses import dataclass
+import unittest
+
+from hyprpy.utils.signals import Signal
+
+
+@dataclass
+class UnhashableCallback:
+    """A callable object which defines ``__eq__`` but not ``__hash__``."""
+
+    calls: int = 0
+
+    def __call__(self, sender, **kwargs):
+        self.calls += 1
+
+
+class TestSignal(unittest.TestCase):
+
+    def test_connect_rejects_unhashable_callback(self):
+        signal = Signal(sender=self)
+
+        with self.assertRaisesRegex(TypeError, "hashable"):
+            signal.connect(UnhashableCallback())
+
+
+    def test_callback_can_disconnect_itself_during_emit(self):
+        signal = Signal(sender=self)
+        called = []
+
+        def once(sender, **kwargs):
+            called.append('once')
+            signal.disconnect(once)
+
+        def always(sender, **kwargs):
+            called.append('always')
+
+        signal.connect(once)
+        signal.connect(always)
+        signal.emit()
+        signal.emit()
+
+        self.assertEqual(called, ['once', 'always', 'always'])
+
+
+if __name__ == '__main__':
+    unittest.main()